@@ -2,27 +2,41 @@ import os
 import time
 import json
 import numpy as np
-from typing import List, Tuple, Dict, Optional
-import whisper
+from typing import Any, List, Tuple, Dict, Optional, Set
+from faster_whisper import WhisperModel
 import librosa
-from moviepy.editor import *
-from moviepy.video.tools.subtitles import SubtitlesClip
-import speech_recognition as sr
-from textblob import TextBlob
+import soundfile
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import re
-from collections import Counter
 import logging
 from urllib.parse import urlparse, parse_qs
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from config import (
     VIDEO_CONFIG, SUBTITLE_CONFIG, 
     ENGAGEMENT_CONFIG, WHISPER_CONFIG, PATHS, PROCESSING_CONFIG
 )
+from ffmpeg_utils import select_video_codec, video_codec_params, video_decode_params
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Whisper models keyed by (backend, model, device, compute_type), shared by every pipeline
+_MODEL_CACHE: Dict[Tuple[str, str, str, str], Any] = {}
+
+# Project roots whose working directories already exist, shared by every pipeline
+_DIRS_READY: Set[str] = set()
+
+# Precompiled patterns and constants for sanitize_filename and text analysis
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|\n\r\t]')
+_NON_PRINTABLE_CHARS = re.compile(r'[^\x20-\x7E]')
+_HEX_COLOR = re.compile(r'#[0-9A-Fa-f]{6}')
+_LAUGHTER_PATTERNS = ('haha', 'lol', 'lmao', '😂', '😄', '😆')
+
+# VADER sentiment scorer; its lexicon is loaded once at import
+_SENTIMENT_ANALYZER = SentimentIntensityAnalyzer()
+
 def clean_youtube_url(url: str) -> str:
     """
     Clean YouTube URL by removing playlist and other parameters
@@ -66,16 +80,96 @@ def sanitize_filename(filename: str) -> str:
     # Replace spaces with underscores
     filename = filename.replace(' ', '_')
     # Remove or replace unsafe characters
-    filename = re.sub(r'[\\/:*?"<>|\n\r\t]', '', filename)
+    filename = _UNSAFE_FILENAME_CHARS.sub('', filename)
     # Replace curly quotes and em/en dashes with safe equivalents
     filename = filename.replace('“', '"').replace('”', '"')
     filename = filename.replace('‘', "'").replace('’', "'")
     filename = filename.replace('—', '-').replace('–', '-')
     # Remove any remaining non-printable or non-ASCII characters
-    filename = re.sub(r'[^\x20-\x7E]', '', filename)
+    filename = _NON_PRINTABLE_CHARS.sub('', filename)
     # Optionally, limit length
     return filename[:80]
 
+def _ass_color(color: str) -> str:
+    """
+    Convert a color name or #RRGGBB hex string to an ASS &HAABBGGRR color
+    
+    Raises:
+        ValueError: If color is neither a known name nor #RRGGBB
+    """
+    named = {
+        'white': '#FFFFFF', 'black': '#000000', 'yellow': '#FFFF00',
+        'red': '#FF0000', 'green': '#00FF00', 'blue': '#0000FF'
+    }
+    hex_color = named.get(color.lower(), color)
+    if not _HEX_COLOR.fullmatch(hex_color):
+        raise ValueError(f"Unsupported subtitle color {color!r}; use a basic color name or #RRGGBB")
+    hex_color = hex_color.lstrip('#')
+    red, green, blue = hex_color[0:2], hex_color[2:4], hex_color[4:6]
+    return f"&H00{blue}{green}{red}".upper()
+
+def _escape_filter_path(path: str) -> str:
+    """
+    Escape a file path for use as a filter option value inside -filter_complex
+    
+    ffmpeg unescapes the value twice: once when splitting the graph into
+    filters, then again when splitting the filter's options, so each level
+    gets its own backslash escapes.
+    """
+    path = path.replace('\\', '/')
+    option_value = re.sub(r"([\\':])", r"\\\1", path)
+    return re.sub(r"([\\'\[\],;])", r"\\\1", option_value)
+
+def resolve_whisper_device() -> Tuple[str, str]:
+    """
+    Pick the device and precision for the Whisper model
+    
+    Returns:
+        Tuple of (device, compute_type); CUDA with half precision when a GPU
+        is available, otherwise the configured CPU quantization
+    """
+    device = WHISPER_CONFIG["device"]
+    if device == "auto":
+        try:
+            import ctranslate2
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except Exception as e:
+            logger.warning(f"Could not detect CUDA devices: {e}")
+            device = "cpu"
+    
+    if device == "cuda":
+        return device, WHISPER_CONFIG["cuda_compute_type"]
+    return device, WHISPER_CONFIG["compute_type"]
+
+def load_whisper_model() -> Any:
+    """
+    Load the configured Whisper model, reusing an already loaded instance
+    
+    Returns:
+        Shared model for the configured backend: a faster-whisper WhisperModel,
+        or a pywhispercpp Model for the whisper.cpp backend
+    """
+    backend = WHISPER_CONFIG["backend"]
+    if backend == "whisper.cpp":
+        # whisper.cpp runs quantized ggml weights on CPU SIMD kernels
+        device, compute_type = "cpu", "ggml"
+    else:
+        device, compute_type = resolve_whisper_device()
+    
+    key = (backend, WHISPER_CONFIG["model"], device, compute_type)
+    if key not in _MODEL_CACHE:
+        logger.info(f"Loading Whisper model with {backend} on {device} ({compute_type})")
+        if backend == "whisper.cpp":
+            from pywhispercpp.model import Model
+            _MODEL_CACHE[key] = Model(WHISPER_CONFIG["model"], n_threads=os.cpu_count())
+        else:
+            _MODEL_CACHE[key] = WhisperModel(
+                WHISPER_CONFIG["model"],
+                device=device,
+                compute_type=compute_type
+            )
+    return _MODEL_CACHE[key]
+
 class YouTubeToShortsPipeline:
     def __init__(self, project_root: str = "."):
         """
@@ -83,13 +177,32 @@ class YouTubeToShortsPipeline:
         
         Args:
             project_root: Root directory for the project
+            
+        Raises:
+            ValueError: If a SUBTITLE_CONFIG color is unsupported
         """
+        # Reject a bad subtitle color now rather than after download,
+        # transcription and analysis, when the ASS track is written
+        for key in ('font_color', 'stroke_color'):
+            _ass_color(SUBTITLE_CONFIG[key])
         self.project_root = project_root
         self.setup_directories()
-        self.model = whisper.load_model("base")  # Load Whisper model
+        self._model = None  # Whisper model, loaded on first transcription
+        self._audio_cache = None  # (path, samples, sample_rate) of the last loaded audio
+    
+    @property
+    def model(self) -> Any:
+        """Whisper model, loaded lazily and shared across pipeline instances"""
+        if self._model is None:
+            self._model = load_whisper_model()
+        return self._model
         
     def setup_directories(self):
-        """Create necessary directories for the project"""
+        """Create necessary directories for the project, once per project root"""
+        root = os.path.abspath(self.project_root)
+        if root in _DIRS_READY:
+            return
+        
         directories = [
             "inputs",
             "outputs", 
@@ -105,6 +218,7 @@ class YouTubeToShortsPipeline:
             if not os.path.exists(dir_path):
                 os.makedirs(dir_path)
                 logger.info(f"Created directory: {dir_path}")
+        _DIRS_READY.add(root)
     
     def download_youtube_video(self, url: str, save_path: str, video_type: str = "video") -> str:
         """
@@ -142,6 +256,7 @@ class YouTubeToShortsPipeline:
                 cmd = [
                     "yt-dlp",
                     "-f", "bestvideo[ext=mp4]+bestaudio[ext=m4a]/mp4",
+                    "--concurrent-fragments", str(PROCESSING_CONFIG["concurrent_fragments"]),
                     "-o", filepath,
                     cleaned_url
                 ]
@@ -164,6 +279,81 @@ class YouTubeToShortsPipeline:
             print("   - Some videos may be restricted")
             raise
     
+    def prepare_podcast(self, podcast_path: str) -> Tuple[str, Dict]:
+        """
+        Extract and transcribe the podcast audio
+        
+        Args:
+            podcast_path: Path to the podcast video
+            
+        Returns:
+            Tuple of (audio_path, transcript_data)
+        """
+        audio_path = self.extract_audio_from_video(podcast_path)
+        return audio_path, self.transcribe_audio(audio_path)
+    
+    def download_podcast(self, podcast_url: str) -> Tuple[str, str, Dict]:
+        """
+        Download the podcast video, then extract and transcribe its audio
+        
+        Args:
+            podcast_url: YouTube URL for the podcast video
+            
+        Returns:
+            Tuple of (podcast_path, audio_path, transcript_data)
+        """
+        podcast_path = self.download_youtube_video(
+            podcast_url,
+            os.path.join(self.project_root, "savedVideos"),
+            "podcast"
+        )
+        audio_path, transcript_data = self.prepare_podcast(podcast_path)
+        return podcast_path, audio_path, transcript_data
+    
+    def download_sources(self, podcast_url: str, gameplay_url: str) -> Tuple[str, str, str, Dict]:
+        """
+        Download both videos concurrently, transcribing the podcast while the
+        gameplay download is still running
+        
+        Args:
+            podcast_url: YouTube URL for the podcast video
+            gameplay_url: YouTube URL for the gameplay video
+            
+        Returns:
+            Tuple of (podcast_path, gameplay_path, audio_path, transcript_data)
+            
+        Raises:
+            RuntimeError: If either side failed; each side's error is
+                reported before raising
+        """
+        # Transcription stays on the podcast worker, so Whisper never
+        # competes with a second transcription for the CPU/GPU
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            podcast_future = executor.submit(self.download_podcast, podcast_url)
+            gameplay_future = executor.submit(
+                self.download_youtube_video,
+                gameplay_url,
+                os.path.join(self.project_root, "gamePlayVid"),
+                "gameplay"
+            )
+        
+        # Leaving the executor waits for both sides, so a failure on one
+        # side is reported without cutting the other off mid-download
+        failed = []
+        try:
+            podcast_path, audio_path, transcript_data = podcast_future.result()
+        except Exception as e:
+            print(f"❌ Error preparing podcast: {e}")
+            failed.append("podcast")
+        try:
+            gameplay_path = gameplay_future.result()
+        except Exception as e:
+            print(f"❌ Error downloading gameplay: {e}")
+            failed.append("gameplay")
+        if failed:
+            raise RuntimeError(f"Could not prepare the {' and '.join(failed)} video")
+        return podcast_path, gameplay_path, audio_path, transcript_data
+    
     def get_time_format(self, seconds: int) -> str:
         """Convert seconds to HH:MM:SS format"""
         if seconds is None:
@@ -174,7 +364,7 @@ class YouTubeToShortsPipeline:
     
     def extract_audio_from_video(self, video_path: str, output_path: str = None) -> str:
         """
-        Extract audio from video file
+        Extract audio from video file as 16 kHz mono WAV (Whisper's input format)
         
         Args:
             video_path: Path to the video file
@@ -191,17 +381,46 @@ class YouTubeToShortsPipeline:
             )
         
         try:
-            video = VideoFileClip(video_path)
-            audio = video.audio
-            audio.write_audiofile(output_path, verbose=False, logger=None)
-            video.close()
-            audio.close()
+            # Let ffmpeg demux and resample the audio stream only; the video
+            # stream is never decoded
+            subprocess.run([
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-i", video_path,
+                "-vn", "-ac", "1", "-ar", "16000",
+                "-acodec", "pcm_s16le",
+                output_path
+            ], capture_output=True, text=True, check=True)
             logger.info(f"Audio extracted to: {output_path}")
             return output_path
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Error extracting audio: {e.stderr.strip() or e}")
+            raise
         except Exception as e:
             logger.error(f"Error extracting audio: {e}")
             raise
     
+    def load_audio(self, audio_path: str) -> Tuple[np.ndarray, int]:
+        """
+        Load audio as 16 kHz mono float32, shared between transcription and analysis
+        
+        Args:
+            audio_path: Path to the audio file
+            
+        Returns:
+            Tuple of (samples, sample_rate)
+        """
+        if self._audio_cache is not None and self._audio_cache[0] == audio_path:
+            return self._audio_cache[1], self._audio_cache[2]
+        
+        # WAVs from extract_audio_from_video are already 16 kHz mono, so a plain
+        # soundfile read is enough; anything else is resampled by librosa
+        audio, sample_rate = soundfile.read(audio_path, dtype='float32')
+        if sample_rate != 16000 or audio.ndim != 1:
+            audio, sample_rate = librosa.load(audio_path, sr=16000, mono=True)
+        
+        self._audio_cache = (audio_path, audio, sample_rate)
+        return audio, sample_rate
+    
     def transcribe_audio(self, audio_path: str) -> Dict:
         """
         Transcribe audio using Whisper
@@ -214,7 +433,17 @@ class YouTubeToShortsPipeline:
         """
         try:
             logger.info("Starting transcription...")
-            result = self.model.transcribe(audio_path)
+            audio, _ = self.load_audio(audio_path)
+            if WHISPER_CONFIG["backend"] == "whisper.cpp":
+                segment_list, language = self._transcribe_whisper_cpp(audio)
+            else:
+                segment_list, language = self._transcribe_faster_whisper(audio)
+            
+            result = {
+                "text": "".join(segment["text"] for segment in segment_list),
+                "segments": segment_list,
+                "language": language
+            }
             
             # Save transcript
             transcript_path = os.path.join(
@@ -233,6 +462,76 @@ class YouTubeToShortsPipeline:
             logger.error(f"Error transcribing audio: {e}")
             raise
     
+    def _transcribe_faster_whisper(self, audio: np.ndarray) -> Tuple[List[Dict], str]:
+        """
+        Transcribe 16 kHz audio with faster-whisper
+        
+        Args:
+            audio: Audio samples
+            
+        Returns:
+            Tuple of (segments in openai-whisper's shape, detected language)
+        """
+        segments, info = self.model.transcribe(
+            audio,
+            language=WHISPER_CONFIG["language"],
+            task=WHISPER_CONFIG["task"],
+            word_timestamps=WHISPER_CONFIG["word_timestamps"],
+            vad_filter=WHISPER_CONFIG["vad_filter"],
+            vad_parameters=dict(
+                min_silence_duration_ms=WHISPER_CONFIG["vad_min_silence_ms"]
+            )
+        )
+        
+        # faster-whisper yields segments lazily; materialize them into the
+        # same shape openai-whisper returned so downstream steps are unchanged.
+        # Timestamps are already mapped back to the original audio when the
+        # VAD filter drops silent regions.
+        segment_list = []
+        for segment in segments:
+            entry = {
+                "id": segment.id,
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text
+            }
+            if segment.words:
+                entry["words"] = [
+                    {"start": word.start, "end": word.end, "word": word.word}
+                    for word in segment.words
+                ]
+            segment_list.append(entry)
+        return segment_list, info.language
+    
+    def _transcribe_whisper_cpp(self, audio: np.ndarray) -> Tuple[List[Dict], str]:
+        """
+        Transcribe 16 kHz audio with whisper.cpp (pywhispercpp)
+        
+        Args:
+            audio: Audio samples
+            
+        Returns:
+            Tuple of (segments in openai-whisper's shape, language)
+        """
+        language = WHISPER_CONFIG["language"] or "auto"
+        segments = self.model.transcribe(
+            audio,
+            language=language,
+            translate=WHISPER_CONFIG["task"] == "translate"
+        )
+        
+        # whisper.cpp timestamps are in centiseconds
+        segment_list = [
+            {
+                "id": idx,
+                "start": segment.t0 / 100,
+                "end": segment.t1 / 100,
+                "text": segment.text
+            }
+            for idx, segment in enumerate(segments)
+        ]
+        return segment_list, language
+    
     def analyze_engagement(self, transcript_data: Dict, audio_path: str) -> List[Dict]:
         """
         Analyze transcript and audio for high-engagement segments
@@ -246,8 +545,10 @@ class YouTubeToShortsPipeline:
         """
         segments = []
         
-        # Load audio for analysis
-        y, sr = librosa.load(audio_path)
+        # Reuse the audio decoded for transcription and compute frame features
+        # once for the whole track
+        y, sr = self.load_audio(audio_path)
+        audio_features = self._compute_audio_features(y, sr)
         
         # Get all segments from transcript
         whisper_segments = transcript_data.get('segments', [])
@@ -257,23 +558,38 @@ class YouTubeToShortsPipeline:
             logger.warning("No segments found in transcript")
             return []
         
+        # Keep segment boundaries as arrays so durations and grouping are vectorized
+        starts = np.fromiter((seg['start'] for seg in whisper_segments), dtype=np.float64,
+                             count=len(whisper_segments))
+        ends = np.fromiter((seg['end'] for seg in whisper_segments), dtype=np.float64,
+                           count=len(whisper_segments))
+        texts = [seg['text'].strip() for seg in whisper_segments]
+        durations = ends - starts
+        
         # Calculate average segment duration
-        avg_duration = sum(seg['end'] - seg['start'] for seg in whisper_segments) / len(whisper_segments)
+        avg_duration = float(durations.mean())
         logger.info(f"Average segment duration: {avg_duration:.2f} seconds")
         
         # Strategy 1: Combine consecutive segments to create longer clips
-        combined_segments = self._combine_segments(whisper_segments, target_duration=30)
+        combined_segments = self._combine_segments(starts, ends, texts, target_duration=30)
         logger.info(f"Created {len(combined_segments)} combined segments")
         
         # Strategy 2: Use individual segments if they're long enough
-        long_segments = [seg for seg in whisper_segments if (seg['end'] - seg['start']) >= 10]
+        long_segments = [whisper_segments[idx] for idx in np.flatnonzero(durations >= 10)]
         logger.info(f"Found {len(long_segments)} segments >= 10 seconds")
         
         # Combine both strategies
         all_candidates = combined_segments + long_segments
         
+        # Score audio for every candidate at once, then combine with text scores
+        audio_scores = self._analyze_audio_engagement(
+            audio_features,
+            np.array([segment['start'] for segment in all_candidates], dtype=np.float64),
+            np.array([segment['end'] for segment in all_candidates], dtype=np.float64)
+        )
+        
         # Analyze each candidate segment
-        for i, segment in enumerate(all_candidates):
+        for segment, audio_score in zip(all_candidates, audio_scores):
             start_time = segment['start']
             end_time = segment['end']
             text = segment['text'].strip()
@@ -281,7 +597,7 @@ class YouTubeToShortsPipeline:
             
             # Calculate engagement score
             engagement_score = self._calculate_engagement_score(
-                text, y, sr, start_time, end_time
+                text, float(audio_score)
             )
             
             segments.append({
@@ -314,60 +630,113 @@ class YouTubeToShortsPipeline:
         
         return suitable_segments[:10]  # Return top 10 segments
     
-    def _combine_segments(self, segments: List[Dict], target_duration: float = 30) -> List[Dict]:
+    def _combine_segments(self, starts: np.ndarray, ends: np.ndarray, texts: List[str],
+                          target_duration: float = 30) -> List[Dict]:
         """
         Combine consecutive segments to create longer clips
         
         Args:
-            segments: List of Whisper segments
+            starts: Start time of each Whisper segment
+            ends: End time of each Whisper segment
+            texts: Stripped text of each Whisper segment
             target_duration: Target duration for combined segments
             
         Returns:
             List of combined segments
         """
         combined = []
-        current_segments = []
-        current_start = None
-        current_text = ""
-        
-        for segment in segments:
-            if current_start is None:
-                current_start = segment['start']
-            
-            current_segments.append(segment)
-            current_text += " " + segment['text'].strip()
-            
-            current_duration = segment['end'] - current_start
-            
-            # If we've reached target duration or this is the last segment
-            if current_duration >= target_duration or segment == segments[-1]:
-                if current_duration >= 10:  # Minimum 10 seconds
-                    combined.append({
-                        'start': current_start,
-                        'end': segment['end'],
-                        'text': current_text.strip(),
-                        'source': 'combined'
-                    })
-                
-                # Reset for next combination
-                current_segments = []
-                current_start = None
-                current_text = ""
+        num_segments = len(starts)
+        # Running maximum keeps the end times sorted for searchsorted even if
+        # Whisper emits a slightly overlapping segment
+        sorted_ends = np.maximum.accumulate(ends)
+        
+        first = 0
+        while first < num_segments:
+            current_start = starts[first]
+            
+            # First segment that reaches the target duration, or the last segment
+            last = max(int(np.searchsorted(sorted_ends, current_start + target_duration)), first)
+            while last < num_segments and ends[last] - current_start < target_duration:
+                last += 1
+            last = min(last, num_segments - 1)
+            
+            current_duration = ends[last] - current_start
+            if current_duration >= 10:  # Minimum 10 seconds
+                combined.append({
+                    'start': float(current_start),
+                    'end': float(ends[last]),
+                    'text': ' '.join(texts[first:last + 1]).strip(),
+                    'source': 'combined'
+                })
+            
+            # Start the next combination after this group
+            first = last + 1
         
         return combined
     
-    def _calculate_engagement_score(self, text: str, audio: np.ndarray, 
-                                  sample_rate: int, start_time: float, 
-                                  end_time: float) -> float:
+    def _compute_audio_features(self, audio: np.ndarray, sample_rate: int,
+                                frame_length: int = 2048,
+                                hop_length: int = 512,
+                                block_frames: int = 2048) -> Dict:
         """
-        Calculate engagement score for a segment
+        Compute frame-level audio features over the whole track in one pass
+        
+        RMS, zero crossing rate and spectral centroid are computed together from
+        one strided view of the samples, a block of frames at a time, so the
+        audio is walked once and memory stays bounded on long podcasts.
         
         Args:
-            text: Text content of the segment
             audio: Audio data
             sample_rate: Audio sample rate
-            start_time: Start time of segment
-            end_time: End time of segment
+            frame_length: Analysis window size in samples
+            hop_length: Samples between consecutive frames
+            block_frames: Frames processed per vectorized block
+            
+        Returns:
+            Dictionary of per-frame RMS, spectral centroid and zero crossing rate
+        """
+        # Pad like librosa's centered frames so frame i is centered on sample i * hop
+        padded = np.pad(np.asarray(audio, dtype=np.float32), frame_length // 2)
+        frames = np.lib.stride_tricks.sliding_window_view(padded, frame_length)[::hop_length]
+        num_frames = len(frames)
+        
+        window = np.hanning(frame_length).astype(np.float32)
+        frequencies = np.fft.rfftfreq(frame_length, d=1.0 / sample_rate)
+        rms = np.empty(num_frames)
+        centroid = np.empty(num_frames)
+        zcr = np.empty(num_frames)
+        
+        for block_start in range(0, num_frames, block_frames):
+            block = frames[block_start:block_start + block_frames]
+            block_slice = slice(block_start, block_start + len(block))
+            
+            rms[block_slice] = np.sqrt(np.mean(block**2, axis=1))
+            
+            signs = np.signbit(block)
+            zcr[block_slice] = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+            
+            magnitude = np.abs(np.fft.rfft(block * window, axis=1))
+            total = magnitude.sum(axis=1)
+            centroid[block_slice] = np.divide(
+                magnitude @ frequencies, total,
+                out=np.zeros(len(block)), where=total > 0
+            )
+        
+        return {
+            'rms': rms,
+            'centroid': centroid,
+            'zcr': zcr,
+            'sample_rate': sample_rate,
+            'hop_length': hop_length
+        }
+    
+    def _calculate_engagement_score(self, text: str, audio_score: float) -> float:
+        """
+        Calculate engagement score for a segment
+        
+        Args:
+            text: Text content of the segment
+            audio_score: Audio engagement score from _analyze_audio_engagement
             
         Returns:
             Engagement score (0-1)
@@ -379,9 +748,6 @@ class YouTubeToShortsPipeline:
         score += text_score * 0.4  # 40% weight for text
         
         # Audio-based analysis
-        audio_score = self._analyze_audio_engagement(
-            audio, sample_rate, start_time, end_time
-        )
         score += audio_score * 0.6  # 60% weight for audio
         
         return min(score, 1.0)
@@ -402,21 +768,20 @@ class YouTubeToShortsPipeline:
         score = 0.0
         
         # Sentiment analysis
-        blob = TextBlob(text)
-        sentiment = blob.sentiment.polarity
+        sentiment = _SENTIMENT_ANALYZER.polarity_scores(text)['compound']
         score += abs(sentiment) * 0.3  # Higher sentiment (positive or negative) = more engaging
         
         # Question detection
-        questions = len(re.findall(r'\?', text))
+        questions = text.count('?')
         score += min(questions * 0.2, 0.3)  # Questions are engaging
         
         # Exclamation detection
-        exclamations = len(re.findall(r'!', text))
+        exclamations = text.count('!')
         score += min(exclamations * 0.15, 0.2)  # Exclamations show excitement
         
         # Laughter detection
-        laughter_patterns = ['haha', 'lol', 'lmao', '😂', '😄', '😆']
-        laughter_count = sum(text.lower().count(pattern) for pattern in laughter_patterns)
+        lowered = text.lower()
+        laughter_count = sum(lowered.count(pattern) for pattern in _LAUGHTER_PATTERNS)
         score += min(laughter_count * 0.1, 0.2)
         
         # Length bonus (not too short, not too long)
@@ -426,213 +791,453 @@ class YouTubeToShortsPipeline:
         
         return min(score, 1.0)
     
-    def _analyze_audio_engagement(self, audio: np.ndarray, sample_rate: int,
-                                start_time: float, end_time: float) -> float:
+    def _analyze_audio_engagement(self, audio_features: Dict, start_times: np.ndarray,
+                                end_times: np.ndarray) -> np.ndarray:
         """
-        Analyze audio for engagement indicators
+        Analyze audio for engagement indicators, for many segments at once
         
         Args:
-            audio: Audio data
-            sample_rate: Audio sample rate
-            start_time: Start time of segment
-            end_time: End time of segment
+            audio_features: Precomputed frame features from _compute_audio_features
+            start_times: Start time of each segment
+            end_times: End time of each segment
             
         Returns:
-            Audio engagement score (0-1)
+            Audio engagement score (0-1) for each segment
         """
-        # Extract segment audio
-        start_sample = int(start_time * sample_rate)
-        end_sample = int(end_time * sample_rate)
-        segment_audio = audio[start_sample:end_sample]
+        # Map the segments onto the precomputed feature frames
+        frames_per_second = audio_features['sample_rate'] / audio_features['hop_length']
+        num_frames = len(audio_features['rms'])
+        start_frames = np.clip((start_times * frames_per_second).astype(int), 0, num_frames)
+        end_frames = np.clip((end_times * frames_per_second).astype(int), 0, num_frames)
+        frame_counts = end_frames - start_frames
+        has_audio = frame_counts > 0
+        frame_counts = np.maximum(frame_counts, 1)
+        
+        # Prefix sums turn every per-segment mean into two lookups
+        def segment_means(values):
+            prefix = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+            return (prefix[end_frames] - prefix[start_frames]) / frame_counts
+        
+        # Volume analysis (frame energies averaged back to segment RMS)
+        rms = np.sqrt(segment_means(audio_features['rms']**2))
+        scores = np.minimum(rms * 10, 0.4)  # Higher volume = more engaging
         
-        if len(segment_audio) == 0:
-            return 0.0
+        # Spectral centroid (brightness)
+        avg_centroid = segment_means(audio_features['centroid'])
+        scores += np.minimum(avg_centroid / 5000, 0.3)  # Brighter sounds = more engaging
         
-        score = 0.0
+        # Zero crossing rate (speech activity)
+        avg_zcr = segment_means(audio_features['zcr'])
+        scores += np.minimum(avg_zcr * 2, 0.3)  # Higher ZCR = more speech activity
         
-        # Volume analysis
-        rms = np.sqrt(np.mean(segment_audio**2))
-        score += min(rms * 10, 0.4)  # Higher volume = more engaging
+        return np.where(has_audio, np.minimum(scores, 1.0), 0.0)
+    
+    def _build_subtitle_chunks(self, transcript_data: Dict, start_time: float,
+                               end_time: float) -> List[Tuple[Tuple[float, float], str]]:
+        """
+        Split the transcript inside a clip into short timed subtitle chunks
         
-        # Spectral centroid (brightness)
-        spectral_centroids = librosa.feature.spectral_centroid(
-            y=segment_audio, sr=sample_rate
-        )[0]
-        avg_centroid = np.mean(spectral_centroids)
-        score += min(avg_centroid / 5000, 0.3)  # Brighter sounds = more engaging
+        Args:
+            transcript_data: Whisper transcription data
+            start_time: Start time of the clip
+            end_time: End time of the clip
+            
+        Returns:
+            List of ((start, end), text) tuples relative to the clip start
+        """
+        # --- Progressive word-by-word chunking ---
+        def chunk_text(text, n=3):
+            words = text.split()
+            return [' '.join(words[i:i+n]) for i in range(0, len(words), n)]
+        chunked_subtitles = []
+        for segment in transcript_data.get('segments', []):
+            if not (segment['start'] >= start_time and segment['end'] <= end_time):
+                continue
+            words = segment.get('words')
+            if words:
+                # Word timestamps give each chunk its real on-screen time
+                for i in range(0, len(words), 3):
+                    group = words[i:i+3]
+                    chunk = ''.join(word['word'] for word in group).strip()
+                    if chunk:
+                        chunked_subtitles.append((
+                            (group[0]['start'] - start_time, group[-1]['end'] - start_time),
+                            chunk
+                        ))
+                continue
+            # Without word timings, spread the chunks evenly over the segment
+            seg_start = segment['start'] - start_time
+            seg_end = segment['end'] - start_time
+            chunks = chunk_text(segment['text'].strip(), n=3)
+            seg_duration = seg_end - seg_start
+            chunk_duration = seg_duration / max(len(chunks), 1)
+            for idx, chunk in enumerate(chunks):
+                chunk_start = seg_start + idx * chunk_duration
+                chunk_end = chunk_start + chunk_duration
+                chunked_subtitles.append(((chunk_start, chunk_end), chunk))
+        return chunked_subtitles
+    
+    def _write_ass(self, subtitles: List[Tuple[Tuple[float, float], str]],
+                   output_path: str) -> str:
+        """
+        Write timed subtitle chunks to an ASS file styled from SUBTITLE_CONFIG
         
-        # Zero crossing rate (speech activity)
-        zcr = librosa.feature.zero_crossing_rate(segment_audio)[0]
-        avg_zcr = np.mean(zcr)
-        score += min(avg_zcr * 2, 0.3)  # Higher ZCR = more speech activity
+        The script's PlayResX/PlayResY match the output size, so font size,
+        outline and margins from the config are exact output pixels.
         
-        return min(score, 1.0)
+        Args:
+            subtitles: List of ((start, end), text) tuples
+            output_path: Path to save the ASS file
+            
+        Returns:
+            Path to the ASS file
+        """
+        def ass_time(seconds):
+            centis = int(round(max(seconds, 0) * 100))
+            hours, centis = divmod(centis, 360000)
+            minutes, centis = divmod(centis, 6000)
+            secs, centis = divmod(centis, 100)
+            return f"{hours}:{minutes:02}:{secs:02}.{centis:02}"
+        
+        width, height = VIDEO_CONFIG['target_width'], VIDEO_CONFIG['target_height']
+        # Numpad-style ASS alignment: bottom, middle or top center
+        alignment = {'bottom': 2, 'center': 5, 'top': 8}.get(SUBTITLE_CONFIG['position'], 5)
+        side_margin = max((width - SUBTITLE_CONFIG['max_width']) // 2, 0)
+        position = ""
+        if alignment == 5:
+            # libass ignores MarginV for middle alignment, so place the text
+            # explicitly. margin_bottom pads a centered text box at the
+            # bottom, lifting the text by half the margin.
+            lift = SUBTITLE_CONFIG['margin_bottom'] / 2
+            position = f"\\pos({width / 2:g},{height / 2 - lift:g})"
+        fade_duration = SUBTITLE_CONFIG['fade_duration']
+        fade_ms = int(fade_duration * 1000)
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(
+                "[Script Info]\n"
+                "ScriptType: v4.00+\n"
+                f"PlayResX: {width}\n"
+                f"PlayResY: {height}\n"
+                "WrapStyle: 0\n"
+                "ScaledBorderAndShadow: yes\n"
+                "\n"
+                "[V4+ Styles]\n"
+                "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+                "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, "
+                "ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+                "Alignment, MarginL, MarginR, MarginV, Encoding\n"
+                f"Style: Default,Arial,{SUBTITLE_CONFIG['font_size']},"
+                f"{_ass_color(SUBTITLE_CONFIG['font_color'])},&H000000FF,"
+                f"{_ass_color(SUBTITLE_CONFIG['stroke_color'])},&H00000000,"
+                f"-1,0,0,0,100,100,0,0,1,{SUBTITLE_CONFIG['stroke_width']},0,"
+                f"{alignment},{side_margin},{side_margin},"
+                f"{SUBTITLE_CONFIG['margin_bottom']},1\n"
+                "\n"
+                "[Events]\n"
+                "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+            )
+            for (start, end), text in subtitles:
+                # Braces open ASS override blocks; escape them in spoken text
+                text = text.replace('{', '\\{').replace('}', '\\}').replace('\n', '\\N')
+                overrides = position
+                # Fading a chunk shorter than both fades would overlap them,
+                # so it would flicker without ever reaching full opacity
+                if SUBTITLE_CONFIG['highlight_effect'] and end - start > 2 * fade_duration:
+                    overrides += f"\\fad({fade_ms},{fade_ms})"
+                if overrides:
+                    overrides = f"{{{overrides}}}"
+                f.write(
+                    f"Dialogue: 0,{ass_time(start)},{ass_time(end)},Default,,0,0,0,,{overrides}{text}\n"
+                )
+        return output_path
     
-    def combine_videos(self, podcast_path: str, gameplay_path: str, 
-                      start_time: float, end_time: float, 
-                      output_path: str = None) -> str:
+    def build_ass(self, transcript_data: Dict, output_path: str = None) -> str:
         """
-        Combine podcast and gameplay videos into a split-screen format with zoomed content
+        Write the whole transcript as one ASS subtitle track
+        
+        Event times stay in source time, so every clip cut from the podcast
+        burns in the same file (see render_clips).
         
         Args:
-            podcast_path: Path to podcast video
-            gameplay_path: Path to gameplay video
-            start_time: Start time for the clip
-            end_time: End time for the clip
-            output_path: Output path for combined video
+            transcript_data: Whisper transcription data
+            output_path: Path to save the ASS file
             
         Returns:
-            Path to the combined video
+            Path to the ASS file
         """
         if output_path is None:
-            output_path = os.path.join(
-                self.project_root,
-                "outputs",
-                f"combined_clip_{start_time}_{end_time}.mp4"
+            output_path = os.path.join(self.project_root, "temp", "subtitles.ass")
+        return self._write_ass(
+            self._build_subtitle_chunks(transcript_data, 0, float('inf')),
+            output_path
+        )
+    
+    def _split_screen_filter(self, podcast_stream: str = "0:v", gameplay_stream: str = "1:v",
+                             output_label: str = "out") -> str:
+        """
+        Build the ffmpeg filtergraph for the podcast/gameplay split screen
+        
+        Each input is scaled to the zoomed target width, anchored to the top
+        of its half and cropped to it, then the two halves are stacked.
+        
+        Args:
+            podcast_stream: ffmpeg stream specifier of the podcast video
+            gameplay_stream: ffmpeg stream specifier of the gameplay video
+            output_label: Label of the produced video stream
+            
+        Returns:
+            Filtergraph string producing the [output_label] video stream
+        """
+        target_width = VIDEO_CONFIG['target_width']
+        half_height = VIDEO_CONFIG['target_height'] // 2
+        zoomed_width = int(target_width * VIDEO_CONFIG['zoom_factor']) // 2 * 2
+        fps = VIDEO_CONFIG['fps']
+        
+        def half(label, out):
+            return (
+                f"[{label}]fps={fps},scale={zoomed_width}:-2,"
+                f"crop='min(iw,{target_width})':'min(ih,{half_height})':(iw-ow)/2:0,"
+                f"pad={target_width}:{half_height}:(ow-iw)/2:0[{out}]"
             )
         
+        top, bottom = f"{output_label}_top", f"{output_label}_bottom"
+        return ";".join([
+            half(podcast_stream, top),
+            half(gameplay_stream, bottom),
+            f"[{top}][{bottom}]vstack=inputs=2,setsar=1[{output_label}]"
+        ])
+    
+    def _group_overlapping_clips(self, clip_times: List[Tuple[float, float]]
+                                 ) -> List[Tuple[float, float, List[int]]]:
+        """
+        Merge overlapping clip windows into covering intervals
+        
+        Args:
+            clip_times: (start_time, end_time) of each clip
+            
+        Returns:
+            List of (start, end, indices of the clips inside) per interval
+        """
+        groups = []
+        for idx in sorted(range(len(clip_times)), key=lambda i: clip_times[i][0]):
+            start_time, end_time = clip_times[idx]
+            if groups and start_time < groups[-1][1]:
+                group_start, group_end, members = groups[-1]
+                groups[-1] = (group_start, max(group_end, end_time), members + [idx])
+            else:
+                groups.append((start_time, end_time, [idx]))
+        return groups
+    
+    def render_clips(self, podcast_path: str, gameplay_path: str,
+                     transcript_data: Dict, clip_times: List[Tuple[float, float]],
+                     output_paths: List[str] = None, subtitle_path: str = None,
+                     burn_subtitles: bool = True) -> List[str]:
+        """
+        Render finished shorts (split screen plus subtitles) with one ffmpeg process
+        
+        Overlapping clips are merged into one covering interval that is decoded
+        and laid out once, then split and trimmed per clip, so frames shared
+        by several clips are only decoded once. ffmpeg starts once and encodes
+        all outputs on a shared thread pool. Every clip burns in its window of
+        one full-transcript ASS track.
+        
+        Args:
+            podcast_path: Path to podcast video
+            gameplay_path: Path to gameplay video
+            transcript_data: Whisper transcription data
+            clip_times: (start_time, end_time) of each clip
+            output_paths: Output path for each final video
+            subtitle_path: ASS track from build_ass; built (and cleaned up)
+                here when not given
+            burn_subtitles: Render the split screen without subtitles when False
+            
+        Returns:
+            Paths to the final videos
+        """
+        if output_paths is None:
+            output_paths = [
+                os.path.join(self.project_root, "outputs", f"final_clip_{start}_{end}.mp4")
+                for start, end in clip_times
+            ]
+        temp_subtitles = burn_subtitles and subtitle_path is None
+        
         try:
-            podcast_clip = VideoFileClip(podcast_path).subclip(start_time, end_time)
-            gameplay_clip = VideoFileClip(gameplay_path).subclip(start_time, end_time)
-            target_width = VIDEO_CONFIG['target_width']
-            target_height = VIDEO_CONFIG['target_height']
-            zoom_factor = VIDEO_CONFIG['zoom_factor']
-            # Resize and zoom podcast clip (top half)
-            podcast_resized = podcast_clip.resize(height=target_height//2).resize(width=target_width)
-            podcast_zoomed = podcast_resized.resize(zoom_factor)
-            podcast_final = podcast_zoomed.set_position(('center', 0))
-            # Resize and zoom gameplay clip (bottom half), mute audio
-            gameplay_resized = gameplay_clip.resize(height=target_height//2).resize(width=target_width)
-            gameplay_zoomed = gameplay_resized.resize(zoom_factor)
-            gameplay_final = gameplay_zoomed.set_position(('center', target_height//2)).without_audio()
-            # Use podcast audio only
-            final_clip = CompositeVideoClip([
-                podcast_final,
-                gameplay_final
-            ], size=(target_width, target_height)).set_audio(podcast_clip.audio)
-            final_clip.write_videofile(
-                output_path,
-                codec=VIDEO_CONFIG['codec'],
-                audio_codec=VIDEO_CONFIG['audio_codec'],
-                temp_audiofile='temp-audio.m4a',
-                remove_temp=True,
-                verbose=False,
-                logger=None
+            if temp_subtitles:
+                subtitle_path = self.build_ass(transcript_data)
+            cmd = self._render_command(
+                podcast_path,
+                gameplay_path,
+                clip_times,
+                output_paths,
+                subtitle_path if burn_subtitles else None
             )
-            podcast_clip.close()
-            gameplay_clip.close()
-            final_clip.close()
-            logger.info(f"Combined video saved to: {output_path}")
-            return output_path
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            for output_path in output_paths:
+                logger.info(f"Final clip saved to: {output_path}")
+            return output_paths
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Error rendering clips: {e.stderr.strip() or e}")
+            raise
         except Exception as e:
-            logger.error(f"Error combining videos: {e}")
+            logger.error(f"Error rendering clips: {e}")
             raise
+        finally:
+            if temp_subtitles and PROCESSING_CONFIG['cleanup_temp']:
+                if subtitle_path is not None and os.path.exists(subtitle_path):
+                    os.remove(subtitle_path)
+    
+    def _render_command(self, podcast_path: str, gameplay_path: str,
+                        clip_times: List[Tuple[float, float]], output_paths: List[str],
+                        subtitle_path: Optional[str]) -> List[str]:
+        """
+        Build the ffmpeg command used by render_clips
+        
+        Args:
+            podcast_path: Path to podcast video
+            gameplay_path: Path to gameplay video
+            clip_times: (start_time, end_time) of each clip
+            output_paths: Output path for each final video
+            subtitle_path: ASS track to burn in, or None for no subtitles
+            
+        Returns:
+            ffmpeg argument list
+        """
+        subtitles = ""
+        if subtitle_path is not None:
+            subtitles = f"ass=filename={_escape_filter_path(subtitle_path)},"
+        codec = select_video_codec()
+        decode_params = video_decode_params(codec)
+        inputs, filters, outputs = [], [], []
+        
+        def add_input(path, start, duration, *params):
+            # Seeking before -i jumps straight to the window instead of decoding up to it
+            inputs.append([*params, "-ss", str(start), "-t", str(duration), "-i", path])
+            return len(inputs) - 1
+        
+        groups = self._group_overlapping_clips(clip_times)
+        for group, (group_start, group_end, members) in enumerate(groups):
+            podcast_input = add_input(podcast_path, group_start, group_end - group_start,
+                                      *decode_params)
+            gameplay_input = add_input(gameplay_path, group_start, group_end - group_start,
+                                       *decode_params)
+            layout = f"group{group}"
+            filters.append(self._split_screen_filter(
+                podcast_stream=f"{podcast_input}:v",
+                gameplay_stream=f"{gameplay_input}:v",
+                output_label=layout
+            ))
+            branches = [layout]
+            if len(members) > 1:
+                branches = [f"{layout}_{idx}" for idx in members]
+                filters.append(
+                    f"[{layout}]split={len(members)}" + "".join(f"[{b}]" for b in branches)
+                )
+            
+            for idx, branch in zip(members, branches):
+                start_time, end_time = clip_times[idx]
+                # Shift frames to source time while the track is drawn, so
+                # libass only renders the dialogue inside this clip's window.
+                # setpts drops the stream's frame rate, which fps restores;
+                # otherwise the encoder falls back to 25 fps.
+                filters.append(
+                    f"[{branch}]trim=start={start_time - group_start}"
+                    f":duration={end_time - start_time},"
+                    f"setpts=PTS-STARTPTS+{start_time}/TB,{subtitles}"
+                    f"setpts=PTS-STARTPTS,fps={VIDEO_CONFIG['fps']},format=yuv420p[out{idx}]"
+                )
+        
+        # Each clip's audio comes from its own seeked input. ffmpeg only
+        # decodes mapped streams, so these never decode the video again.
+        for idx, (start_time, end_time) in enumerate(clip_times):
+            audio_input = add_input(podcast_path, start_time, end_time - start_time)
+            outputs += [
+                "-map", f"[out{idx}]", "-map", f"{audio_input}:a?",
+                "-c:v", codec, *video_codec_params(codec),
+                "-c:a", VIDEO_CONFIG['audio_codec'],
+                output_paths[idx]
+            ]
+        
+        logger.info(f"Decoding {len(clip_times)} clips from {len(groups)} covering intervals")
+        
+        return [
+            "ffmpeg", "-y", "-loglevel", "error",
+            *(arg for args in inputs for arg in args),
+            "-filter_complex", ";".join(filters),
+            *outputs
+        ]
     
-    def add_subtitles(self, video_path: str, transcript_data: Dict,
-                     start_time: float, end_time: float,
-                     output_path: str = None) -> str:
+    def render_clip(self, podcast_path: str, gameplay_path: str,
+                    transcript_data: Dict, start_time: float, end_time: float,
+                    output_path: str = None, subtitle_path: str = None,
+                    burn_subtitles: bool = True) -> str:
         """
-        Add styled subtitles to video with highlighting effects
+        Render a finished short (split screen plus subtitles) in one ffmpeg pass
         
         Args:
-            video_path: Path to input video
+            podcast_path: Path to podcast video
+            gameplay_path: Path to gameplay video
             transcript_data: Whisper transcription data
-            start_time: Start time of the clip
-            end_time: End time of the clip
-            output_path: Output path for video with subtitles
+            start_time: Start time for the clip
+            end_time: End time for the clip
+            output_path: Output path for the final video
+            subtitle_path: ASS track from build_ass, if already written
+            burn_subtitles: Render the split screen without subtitles when False
             
         Returns:
-            Path to video with subtitles
+            Path to the final video
         """
-        if output_path is None:
-            output_path = os.path.join(
-                self.project_root,
-                "outputs",
-                f"final_clip_{start_time}_{end_time}.mp4"
-            )
+        output_paths = [output_path] if output_path is not None else None
+        return self.render_clips(
+            podcast_path,
+            gameplay_path,
+            transcript_data,
+            [(start_time, end_time)],
+            output_paths,
+            subtitle_path,
+            burn_subtitles
+        )[0]
+    
+    def _render_clip_with_fallback(self, podcast_path: str, gameplay_path: str,
+                                   transcript_data: Dict, start_time: float, end_time: float,
+                                   subtitle_path: str) -> str:
+        """
+        Render one clip, retrying without subtitles if ffmpeg fails with them
         
+        Args:
+            podcast_path: Path to podcast video
+            gameplay_path: Path to gameplay video
+            transcript_data: Whisper transcription data
+            start_time: Start time for the clip
+            end_time: End time for the clip
+            subtitle_path: ASS track from build_ass
+            
+        Returns:
+            Path to the final video
+        """
         try:
-            # Extract relevant subtitles for the time range
-            subtitles = []
-            for segment in transcript_data.get('segments', []):
-                if (segment['start'] >= start_time and segment['end'] <= end_time):
-                    adjusted_start = segment['start'] - start_time
-                    adjusted_end = segment['end'] - start_time
-                    subtitles.append((
-                        (adjusted_start, adjusted_end),
-                        segment['text'].strip()
-                    ))
-            # --- Progressive word-by-word chunking ---
-            def chunk_text(text, n=3):
-                words = text.split()
-                return [' '.join(words[i:i+n]) for i in range(0, len(words), n)]
-            chunked_subtitles = []
-            for (seg_start, seg_end), text in subtitles:
-                chunks = chunk_text(text, n=3)
-                seg_duration = seg_end - seg_start
-                chunk_duration = seg_duration / max(len(chunks), 1)
-                for idx, chunk in enumerate(chunks):
-                    chunk_start = seg_start + idx * chunk_duration
-                    chunk_end = chunk_start + chunk_duration
-                    chunked_subtitles.append(((chunk_start, chunk_end), chunk))
-            # --- Subtitle rendering ---
-            def make_subtitle(txt):
-                try:
-                    return TextClip(
-                        txt,
-                        font='Arial-Bold',
-                        fontsize=SUBTITLE_CONFIG['font_size'],
-                        color='white',
-                        stroke_color='white',
-                        stroke_width=SUBTITLE_CONFIG['stroke_width'],
-                        method='caption',
-                        size=(SUBTITLE_CONFIG['max_width'], None),
-                        align='center'
-                    ).set_position(('center', 'center')).margin(bottom=SUBTITLE_CONFIG['margin_bottom'])
-                except Exception as e:
-                    logger.warning(f"ImageMagick text rendering failed: {e}")
-                    try:
-                        return TextClip(
-                            txt,
-                            fontsize=SUBTITLE_CONFIG['font_size'],
-                            color='white',
-                            method='caption',
-                            size=(SUBTITLE_CONFIG['max_width'], None),
-                            align='center'
-                        ).set_position(('center', 'center')).margin(bottom=SUBTITLE_CONFIG['margin_bottom'])
-                    except Exception as e2:
-                        logger.error(f"Text rendering completely failed: {e2}")
-                        from moviepy.video.VideoClip import ColorClip
-                        return ColorClip(size=(1, 1), color=(0, 0, 0)).set_duration(0.1)
-            subtitle_clips = []
-            fade_duration = SUBTITLE_CONFIG['fade_duration']
-            highlight_enabled = SUBTITLE_CONFIG['highlight_effect']
-            for (start, end), text in chunked_subtitles:
-                subtitle_clip = make_subtitle(text)
-                subtitle_with_fade = subtitle_clip.set_start(start).set_end(end)
-                if highlight_enabled and end - start > 2 * fade_duration:
-                    subtitle_with_fade = subtitle_with_fade.fadein(fade_duration).fadeout(fade_duration)
-                subtitle_clips.append(subtitle_with_fade)
-            video = VideoFileClip(video_path)
-            final_video = CompositeVideoClip([video] + subtitle_clips)
-            final_video.write_videofile(
-                output_path,
-                codec=VIDEO_CONFIG['codec'],
-                audio_codec=VIDEO_CONFIG['audio_codec'],
-                verbose=False,
-                logger=None
+            return self.render_clip(
+                podcast_path,
+                gameplay_path,
+                transcript_data,
+                start_time,
+                end_time,
+                subtitle_path=subtitle_path
+            )
+        except subprocess.CalledProcessError:
+            logger.info("Rendering clip without subtitles due to error")
+            return self.render_clip(
+                podcast_path,
+                gameplay_path,
+                transcript_data,
+                start_time,
+                end_time,
+                burn_subtitles=False
             )
-            video.close()
-            final_video.close()
-            logger.info(f"Video with subtitles saved to: {output_path}")
-            return output_path
-        except Exception as e:
-            logger.error(f"Error adding subtitles: {e}")
-            logger.info("Returning video without subtitles due to error")
-            return video_path
     
     def process_pipeline(self, podcast_path: str, gameplay_path: str,
-                        num_clips: int = 5) -> List[str]:
+                        num_clips: int = 5, audio_path: str = None,
+                        transcript_data: Dict = None) -> List[str]:
         """
         Run the complete pipeline
         
@@ -640,6 +1245,9 @@ class YouTubeToShortsPipeline:
             podcast_path: Path to podcast video
             gameplay_path: Path to gameplay video
             num_clips: Number of clips to generate
+            audio_path: Podcast audio already on disk (e.g. from
+                download_sources); skips extracting it from the video
+            transcript_data: Transcript of audio_path, if already transcribed
             
         Returns:
             List of paths to generated short videos
@@ -647,12 +1255,18 @@ class YouTubeToShortsPipeline:
         logger.info("Starting YouTube to Shorts pipeline...")
         
         # Step 1: Extract audio from podcast
-        logger.info("Step 1: Extracting audio from podcast...")
-        audio_path = self.extract_audio_from_video(podcast_path)
+        if audio_path is None:
+            logger.info("Step 1: Extracting audio from podcast...")
+            audio_path = self.extract_audio_from_video(podcast_path)
+        else:
+            logger.info(f"Step 1: Using existing podcast audio: {audio_path}")
         
         # Step 2: Transcribe audio
-        logger.info("Step 2: Transcribing audio...")
-        transcript_data = self.transcribe_audio(audio_path)
+        if transcript_data is None:
+            logger.info("Step 2: Transcribing audio...")
+            transcript_data = self.transcribe_audio(audio_path)
+        else:
+            logger.info("Step 2: Using existing transcript")
         
         # Step 3: Analyze engagement
         logger.info("Step 3: Analyzing engagement...")
@@ -664,32 +1278,43 @@ class YouTubeToShortsPipeline:
         
         # Step 4: Generate clips
         logger.info("Step 4: Generating clips...")
-        generated_clips = []
+        clip_times = [
+            (segment['start_time'], segment['end_time'])
+            for segment in engagement_segments[:num_clips]
+        ]
         
-        for i, segment in enumerate(engagement_segments[:num_clips]):
-            logger.info(f"Processing clip {i+1}/{min(num_clips, len(engagement_segments))}")
-            
-            # Combine videos
-            combined_path = self.combine_videos(
-                podcast_path,
-                gameplay_path,
-                segment['start_time'],
-                segment['end_time']
-            )
-            
-            # Add subtitles
-            final_path = self.add_subtitles(
-                combined_path,
-                transcript_data,
-                segment['start_time'],
-                segment['end_time']
-            )
-            
-            generated_clips.append(final_path)
-            
-            # Clean up intermediate file
-            if os.path.exists(combined_path):
-                os.remove(combined_path)
+        # One subtitle track for the whole transcript, shared by every clip.
+        # It goes under a fixed name in temp/: names derived from video titles
+        # can carry characters that are awkward inside a filtergraph.
+        subtitle_path = self.build_ass(transcript_data)
+        try:
+            # Combine videos and burn in subtitles for every clip in one ffmpeg run
+            try:
+                logger.info(f"Rendering {len(clip_times)} clips in one ffmpeg pass")
+                generated_clips = self.render_clips(
+                    podcast_path,
+                    gameplay_path,
+                    transcript_data,
+                    clip_times,
+                    subtitle_path=subtitle_path
+                )
+            except subprocess.CalledProcessError:
+                # A single bad window fails the whole batch; retry clip by clip
+                logger.warning("Batched render failed, rendering clips one at a time")
+                generated_clips = []
+                for i, (start_time, end_time) in enumerate(clip_times):
+                    logger.info(f"Processing clip {i+1}/{len(clip_times)}")
+                    generated_clips.append(self._render_clip_with_fallback(
+                        podcast_path,
+                        gameplay_path,
+                        transcript_data,
+                        start_time,
+                        end_time,
+                        subtitle_path
+                    ))
+        finally:
+            if PROCESSING_CONFIG['cleanup_temp'] and os.path.exists(subtitle_path):
+                os.remove(subtitle_path)
         
         logger.info(f"Pipeline completed! Generated {len(generated_clips)} clips.")
         return generated_clips
@@ -749,16 +1374,8 @@ def main():
         
         # Download videos
         print(f"\n📥 Downloading videos...")
-        podcast_path = pipeline.download_youtube_video(
-            podcast_url, 
-            os.path.join(pipeline.project_root, "savedVideos"),
-            "podcast"
-        )
-        
-        gameplay_path = pipeline.download_youtube_video(
-            gameplay_url,
-            os.path.join(pipeline.project_root, "gamePlayVid"),
-            "gameplay"
+        podcast_path, gameplay_path, audio_path, transcript_data = pipeline.download_sources(
+            podcast_url, gameplay_url
         )
         
         # Run pipeline
@@ -766,7 +1383,9 @@ def main():
         generated_clips = pipeline.process_pipeline(
             podcast_path, 
             gameplay_path, 
-            num_clips=num_clips
+            num_clips=num_clips,
+            audio_path=audio_path,
+            transcript_data=transcript_data
         )
         
         if generated_clips:
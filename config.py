@@ -1,28 +1,43 @@
 """
 Configuration file for YouTube to Shorts pipeline
+
+Settings are read-only mappings; edit the values here rather than
+mutating them at runtime.
 """
 
+from types import MappingProxyType
+
 # Video settings
-VIDEO_CONFIG = {
+VIDEO_CONFIG = MappingProxyType({
     "target_width": 1080,
     "target_height": 1920,  # 9:16 aspect ratio for shorts
     "zoom_factor": 1.3,  # Zoom factor for both podcast and gameplay videos
     "fps": 30,
-    "codec": "libx264",
+    "codec": "libx264",  # Software encoder, used when no hardware encoder works
+    "hardware_codecs": ("h264_nvenc", "h264_videotoolbox", "h264_qsv"),  # Tried in order; () disables
+    "codec_params": MappingProxyType({  # Extra ffmpeg output options per encoder
+        "h264_nvenc": ("-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "22"),
+        "h264_videotoolbox": ("-b:v", "6M", "-allow_sw", "1"),
+        "h264_qsv": ("-preset", "faster", "-global_quality", "23")
+    }),
+    "hwaccels": MappingProxyType({  # Hardware decoder used alongside each encoder
+        "h264_nvenc": "cuda",
+        "h264_videotoolbox": "videotoolbox"
+    }),
     "audio_codec": "aac"
-}
+})
 
 # Engagement analysis settings
-ENGAGEMENT_CONFIG = {
+ENGAGEMENT_CONFIG = MappingProxyType({
     "min_clip_duration": 15,  # seconds
     "max_clip_duration": 60,  # seconds
     "text_weight": 0.4,  # Weight for text-based analysis
     "audio_weight": 0.6,  # Weight for audio-based analysis
     "max_segments": 10  # Maximum number of segments to analyze
-}
+})
 
 # Subtitle settings
-SUBTITLE_CONFIG = {
+SUBTITLE_CONFIG = MappingProxyType({
     "font_size": 45,
     "font_color": "white",
     "stroke_color": "black",
@@ -32,27 +47,35 @@ SUBTITLE_CONFIG = {
     "margin_bottom": 100,  # Margin from bottom in pixels
     "fade_duration": 0.3,  # Fade in/out duration in seconds
     "highlight_effect": True,  # Enable fade in/out highlighting
-}
+})
 
 # Whisper settings
-WHISPER_CONFIG = {
+WHISPER_CONFIG = MappingProxyType({
+    "backend": "faster-whisper",  # 'faster-whisper' or 'whisper.cpp' (pip install pywhispercpp)
     "model": "base",  # Options: tiny, base, small, medium, large
     "language": None,  # Auto-detect
-    "task": "transcribe"
-}
+    "task": "transcribe",
+    "device": "auto",  # 'auto', 'cpu' or 'cuda'
+    "compute_type": "int8",  # CPU quantization: int8, float32
+    "cuda_compute_type": "int8_float16",  # GPU precision: int8_float16, float16
+    "word_timestamps": True,  # Per-word timings, used to time subtitle chunks
+    "vad_filter": True,  # Skip non-speech regions with Silero VAD before decoding
+    "vad_min_silence_ms": 500  # Minimum silence length (ms) the VAD will drop
+})
 
 # File paths
-PATHS = {
+PATHS = MappingProxyType({
     "inputs": "inputs",
     "outputs": "outputs",
     "transcripts": "transcripts",
     "temp": "temp",
     "audio_segments": "audio_segments"
-}
+})
 
 # Processing settings
-PROCESSING_CONFIG = {
+PROCESSING_CONFIG = MappingProxyType({
     "num_clips": 5,  # Default number of clips to generate
     "cleanup_temp": True,  # Clean up temporary files
+    "concurrent_fragments": 8,  # Parallel fragment downloads per yt-dlp process
     "verbose": False  # Verbose output
-} 
\ No newline at end of file
+})
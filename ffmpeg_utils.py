@@ -0,0 +1,74 @@
+"""
+Helpers for picking the ffmpeg video encoder (and matching hardware decoder)
+used by the pipeline
+"""
+
+import functools
+import logging
+import subprocess
+from typing import List, Set
+from config import VIDEO_CONFIG
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=None)
+def available_encoders() -> Set[str]:
+    """Names of the video encoders compiled into the local ffmpeg build"""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, check=True
+        )
+    except Exception as e:
+        logger.warning(f"Could not list ffmpeg encoders: {e}")
+        return set()
+    
+    encoders = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        # Encoder rows look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+        if len(parts) >= 2 and parts[0].startswith("V"):
+            encoders.add(parts[1])
+    return encoders
+
+def _encoder_works(codec: str) -> bool:
+    """Check that an encoder can actually open (driver and device present)"""
+    try:
+        subprocess.run([
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=size=256x256:rate=30",
+            "-frames:v", "1", "-c:v", codec, "-f", "null", "-"
+        ], capture_output=True, check=True, timeout=30)
+        return True
+    except Exception:
+        return False
+
+@functools.lru_cache(maxsize=None)
+def select_video_codec() -> str:
+    """
+    Pick the video encoder for rendered clips
+    
+    Returns:
+        First hardware encoder from VIDEO_CONFIG that works on this machine,
+        otherwise the software codec
+    """
+    compiled = available_encoders()
+    for codec in VIDEO_CONFIG["hardware_codecs"]:
+        if codec in compiled and _encoder_works(codec):
+            logger.info(f"Using hardware video encoder: {codec}")
+            return codec
+    return VIDEO_CONFIG["codec"]
+
+def video_codec_params(codec: str) -> List[str]:
+    """Extra ffmpeg output options for an encoder, from VIDEO_CONFIG"""
+    return list(VIDEO_CONFIG["codec_params"].get(codec, []))
+
+def video_decode_params(codec: str) -> List[str]:
+    """
+    ffmpeg input options that decode on the same hardware as the encoder
+    
+    Goes before each -i; ffmpeg falls back to software decoding for streams
+    the hardware decoder cannot handle.
+    """
+    hwaccel = VIDEO_CONFIG["hwaccels"].get(codec)
+    return ["-hwaccel", hwaccel] if hwaccel else []
@@ -6,13 +6,42 @@ Command-line interface for YouTube to Shorts pipeline
 import argparse
 import os
 import sys
-from clips import YouTubeToShortsPipeline
 from config import PROCESSING_CONFIG
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="YouTube to Shorts Pipeline - Convert long videos to engaging short clips"
+__version__ = "0.1"
+
+DESCRIPTION = "YouTube to Shorts Pipeline - Convert long videos to engaging short clips"
+VERSION = f"ClipsMaker {__version__}"
+
+def _add_mode_arguments(parser):
+    """Add the options shared by interactive and command-line mode"""
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable verbose output"
+    )
+    
+    parser.add_argument(
+        "--interactive", "-i",
+        action="store_true",
+        help="Run in interactive mode (prompt for URLs)"
+    )
+    
+    parser.add_argument(
+        "--version", "-V",
+        action="version",
+        version=VERSION
     )
+
+def _build_interactive_parser():
+    """Parser for interactive mode, which prompts for sources instead of taking them"""
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    _add_mode_arguments(parser)
+    return parser
+
+def _build_parser():
+    """Full parser with the source, clip count and output options"""
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
     
     # Input options - either URLs or file paths
     input_group = parser.add_mutually_exclusive_group(required=True)
@@ -65,19 +94,27 @@ def main():
         help="Output directory for generated clips (default: outputs)"
     )
     
-    parser.add_argument(
-        "--verbose", "-v",
-        action="store_true",
-        help="Enable verbose output"
-    )
+    _add_mode_arguments(parser)
+    return parser
+
+def main():
+    argv = sys.argv[1:]
     
-    parser.add_argument(
-        "--interactive", "-i",
-        action="store_true",
-        help="Run in interactive mode (prompt for URLs)"
-    )
+    # Answer --version before building any parser or importing the pipeline
+    if {"-V", "--version"} & set(argv):
+        print(VERSION)
+        return
+    
+    # Interactive mode prompts for its sources, so skip building (and
+    # enforcing) the source arguments unless help was asked for
+    if ({"-i", "--interactive"} & set(argv)) and not ({"-h", "--help"} & set(argv)):
+        args = _build_interactive_parser().parse_args(argv)
+    else:
+        args = _build_parser().parse_args(argv)
     
-    args = parser.parse_args()
+    # Deferred until the arguments are valid: clips pulls in faster-whisper,
+    # librosa and NumPy, which --help and usage errors never need
+    from clips import YouTubeToShortsPipeline
     
     # Handle interactive mode
     if args.interactive:
@@ -89,16 +126,8 @@ def main():
         
         # Download videos
         print(f"\n📥 Downloading videos...")
-        podcast_path = pipeline.download_youtube_video(
-            podcast_url, 
-            os.path.join(pipeline.project_root, "savedVideos"),
-            "podcast"
-        )
-        
-        gameplay_path = pipeline.download_youtube_video(
-            gameplay_url,
-            os.path.join(pipeline.project_root, "gamePlayVid"),
-            "gameplay"
+        podcast_path, gameplay_path, audio_path, transcript_data = pipeline.download_sources(
+            podcast_url, gameplay_url
         )
         
         # Run pipeline
@@ -106,7 +135,9 @@ def main():
         generated_clips = pipeline.process_pipeline(
             podcast_path, 
             gameplay_path, 
-            num_clips=num_clips
+            num_clips=num_clips,
+            audio_path=audio_path,
+            transcript_data=transcript_data
         )
         
         if generated_clips:
@@ -128,56 +159,70 @@ def main():
         print("Use --help for usage information")
         sys.exit(1)
     
-    # Initialize pipeline
-    pipeline = YouTubeToShortsPipeline()
-    
-    # Set output directory
-    if args.output_dir != "outputs":
-        pipeline.project_root = args.output_dir
-        pipeline.setup_directories()
+    # Initialize pipeline; a custom output directory becomes its project root
+    project_root = args.output_dir if args.output_dir != "outputs" else "."
+    pipeline = YouTubeToShortsPipeline(project_root=project_root)
     
     print("🎬 YouTube to Shorts Pipeline")
     print("=" * 40)
     
-    # Handle podcast source
-    if args.podcast_url or args.podcast_youtube:
-        podcast_url = args.podcast_url or args.podcast_youtube
-        print(f"Podcast URL: {podcast_url}")
-        try:
-            podcast_path = pipeline.download_youtube_video(
-                podcast_url,
-                os.path.join(pipeline.project_root, "savedVideos"),
-                "podcast"
-            )
-        except Exception as e:
-            print(f"❌ Error downloading podcast: {e}")
-            sys.exit(1)
-    else:
-        podcast_path = args.podcast
-        if not os.path.exists(podcast_path):
-            print(f"❌ Error: Podcast video not found: {podcast_path}")
-            sys.exit(1)
-        print(f"Podcast file: {podcast_path}")
+    podcast_url = args.podcast_url or args.podcast_youtube
+    gameplay_url = args.gameplay_url or args.gameplay_youtube
     
-    # Handle gameplay source
-    if args.gameplay_url or args.gameplay_youtube:
-        gameplay_url = args.gameplay_url or args.gameplay_youtube
+    audio_path = transcript_data = None
+    if podcast_url and gameplay_url:
+        # Both sources are remote: overlap the two downloads
+        print(f"Podcast URL: {podcast_url}")
         print(f"Gameplay URL: {gameplay_url}")
+        # The podcast is transcribed while the gameplay video is still downloading
         try:
-            gameplay_path = pipeline.download_youtube_video(
-                gameplay_url,
-                os.path.join(pipeline.project_root, "gamePlayVid"),
-                "gameplay"
+            podcast_path, gameplay_path, audio_path, transcript_data = (
+                pipeline.download_sources(podcast_url, gameplay_url)
             )
-        except Exception as e:
-            print(f"❌ Error downloading gameplay: {e}")
+        except RuntimeError:
             sys.exit(1)
     else:
-        gameplay_path = args.gameplay
-        if not os.path.exists(gameplay_path):
-            print(f"❌ Error: Gameplay video not found: {gameplay_path}")
-            sys.exit(1)
-        print(f"Gameplay file: {gameplay_path}")
+        # Handle podcast source
+        if podcast_url:
+            print(f"Podcast URL: {podcast_url}")
+            try:
+                podcast_path = pipeline.download_youtube_video(
+                    podcast_url,
+                    os.path.join(pipeline.project_root, "savedVideos"),
+                    "podcast"
+                )
+            except Exception as e:
+                print(f"❌ Error downloading podcast: {e}")
+                sys.exit(1)
+        else:
+            podcast_path = args.podcast
+            try:
+                podcast_size = os.stat(podcast_path).st_size
+            except OSError:
+                print(f"❌ Error: Podcast video not found: {podcast_path}")
+                sys.exit(1)
+            print(f"Podcast file: {podcast_path} ({podcast_size / 1e6:.1f} MB)")
+    
+        # Handle gameplay source
+        if gameplay_url:
+            print(f"Gameplay URL: {gameplay_url}")
+            try:
+                gameplay_path = pipeline.download_youtube_video(
+                    gameplay_url,
+                    os.path.join(pipeline.project_root, "gamePlayVid"),
+                    "gameplay"
+                )
+            except Exception as e:
+                print(f"❌ Error downloading gameplay: {e}")
+                sys.exit(1)
+        else:
+            gameplay_path = args.gameplay
+            try:
+                gameplay_size = os.stat(gameplay_path).st_size
+            except OSError:
+                print(f"❌ Error: Gameplay video not found: {gameplay_path}")
+                sys.exit(1)
+            print(f"Gameplay file: {gameplay_path} ({gameplay_size / 1e6:.1f} MB)")
     
     print(f"Clips to generate: {args.clips}")
     print(f"Output directory: {args.output_dir}")
@@ -188,7 +233,9 @@ def main():
         generated_clips = pipeline.process_pipeline(
             podcast_path,
             gameplay_path,
-            num_clips=args.clips
+            num_clips=args.clips,
+            audio_path=audio_path,
+            transcript_data=transcript_data
         )
         
         if generated_clips:
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the engagement analysis helpers
+"""
+
+import tempfile
+import librosa
+import numpy as np
+from clips import YouTubeToShortsPipeline
+
+# Whisper-like segments: mostly back to back, one overlapping its neighbour,
+# one long enough to fill a group on its own and a short tail
+SEGMENTS = [
+    (0.0, 4.5, "Welcome back to the show."),
+    (4.5, 9.0, "Today we talk about speedrunning."),
+    (8.8, 15.2, "It started as a joke, honestly."),
+    (15.2, 22.0, "Then it took over my whole life!"),
+    (22.0, 31.5, "Wait, what?"),
+    (31.5, 70.0, "So here is the full story from the beginning."),
+    (70.0, 73.0, "Ha."),
+    (73.0, 79.5, "Anyway, let's move on."),
+    (79.5, 86.0, "Next question from chat?"),
+]
+
+def _combine_segments_reference(segments, target_duration=30):
+    """The original segment-by-segment grouping loop"""
+    combined = []
+    current_start = None
+    current_text = ""
+    for segment in segments:
+        if current_start is None:
+            current_start = segment['start']
+        current_text += " " + segment['text'].strip()
+        current_duration = segment['end'] - current_start
+        if current_duration >= target_duration or segment == segments[-1]:
+            if current_duration >= 10:
+                combined.append({
+                    'start': current_start,
+                    'end': segment['end'],
+                    'text': current_text.strip(),
+                    'source': 'combined'
+                })
+            current_start = None
+            current_text = ""
+    return combined
+
+def _audio_engagement_reference(audio_features, start_time, end_time):
+    """The original per-candidate audio scoring, slicing frames for each segment"""
+    frames_per_second = audio_features['sample_rate'] / audio_features['hop_length']
+    start_frame = int(start_time * frames_per_second)
+    end_frame = int(end_time * frames_per_second)
+    segment_rms = audio_features['rms'][start_frame:end_frame]
+    if len(segment_rms) == 0:
+        return 0.0
+    score = 0.0
+    rms = np.sqrt(np.mean(segment_rms**2))
+    score += min(rms * 10, 0.4)
+    avg_centroid = np.mean(audio_features['centroid'][start_frame:end_frame])
+    score += min(avg_centroid / 5000, 0.3)
+    avg_zcr = np.mean(audio_features['zcr'][start_frame:end_frame])
+    score += min(avg_zcr * 2, 0.3)
+    return min(score, 1.0)
+
+def test_combine_segments_matches_reference():
+    """Array-based grouping gives the same groups as the original loop"""
+    segments = [{'start': s, 'end': e, 'text': t} for s, e, t in SEGMENTS]
+    starts = np.array([s for s, _, _ in SEGMENTS])
+    ends = np.array([e for _, e, _ in SEGMENTS])
+    texts = [t for _, _, t in SEGMENTS]
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = YouTubeToShortsPipeline(project_root=tmp)
+        for target_duration in (5, 10, 15, 30, 60, 120):
+            expected = _combine_segments_reference(segments, target_duration)
+            actual = pipeline._combine_segments(starts, ends, texts, target_duration)
+            assert actual == expected, f"target_duration={target_duration}"
+
+def test_audio_features_match_librosa():
+    """Fused per-frame features line up with librosa's, frame for frame"""
+    sample_rate, frame_length, hop_length = 16000, 2048, 512
+    t = np.arange(int(sample_rate * 2.5)) / sample_rate
+    noise = np.random.default_rng(0).standard_normal(len(t))
+    # A tone, then noise, overlapping for a moment
+    audio = (0.5 * np.sin(2 * np.pi * 220 * t) * (t < 1.2)
+             + 0.1 * noise * (t >= 1.0)).astype(np.float32)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = YouTubeToShortsPipeline(project_root=tmp)
+        features = pipeline._compute_audio_features(
+            audio, sample_rate, frame_length=frame_length, hop_length=hop_length
+        )
+        # Small blocks must give exactly the same result as one big block
+        blocked = pipeline._compute_audio_features(
+            audio, sample_rate, frame_length=frame_length, hop_length=hop_length,
+            block_frames=16
+        )
+    
+    spectrum = np.abs(librosa.stft(audio, n_fft=frame_length, hop_length=hop_length))
+    expected = {
+        'rms': librosa.feature.rms(
+            y=audio, frame_length=frame_length, hop_length=hop_length
+        )[0],
+        'centroid': librosa.feature.spectral_centroid(
+            S=spectrum, sr=sample_rate, n_fft=frame_length, hop_length=hop_length
+        )[0],
+        'zcr': librosa.feature.zero_crossing_rate(
+            audio, frame_length=frame_length, hop_length=hop_length
+        )[0],
+    }
+    for name in expected:
+        assert len(features[name]) == len(expected[name]), name
+        np.testing.assert_array_equal(features[name], blocked[name])
+    
+    np.testing.assert_allclose(features['rms'], expected['rms'], rtol=1e-5, atol=1e-7)
+    # np.hanning is symmetric while librosa's Hann window is periodic
+    np.testing.assert_allclose(features['centroid'], expected['centroid'], rtol=1e-2)
+    # librosa pads the edges differently for ZCR; allow a couple of crossings
+    np.testing.assert_allclose(features['zcr'], expected['zcr'], atol=2 / frame_length)
+    assert features['sample_rate'] == sample_rate
+    assert features['hop_length'] == hop_length
+
+def test_audio_engagement_matches_reference():
+    """Prefix-sum scoring of all candidates matches per-segment slicing"""
+    sample_rate = 16000
+    windows = [
+        (0.0, 2.5),    # the whole signal
+        (0.1, 1.1),
+        (1.3, 2.2),
+        (0.9, 1.3),
+        (0.5, 0.5),    # zero length
+        (0.50, 0.51),  # shorter than one frame
+        (2.0, 4.0),    # runs past the end of the audio
+        (3.0, 5.0),    # starts after the end of the audio
+    ]
+    # A quiet chirp that gets louder, so no score term saturates at its cap
+    t = np.arange(int(sample_rate * 2.5)) / sample_rate
+    audio = ((0.005 + 0.01 * t) * np.sin(2 * np.pi * (200 * t + 160 * t**2))
+             + 0.0001 * np.random.default_rng(1).standard_normal(len(t))).astype(np.float32)
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = YouTubeToShortsPipeline(project_root=tmp)
+        features = pipeline._compute_audio_features(audio, sample_rate)
+        scores = pipeline._analyze_audio_engagement(
+            features,
+            np.array([start for start, _ in windows]),
+            np.array([end for _, end in windows])
+        )
+    
+    expected = [_audio_engagement_reference(features, start, end) for start, end in windows]
+    np.testing.assert_allclose(scores, expected, rtol=1e-9, atol=1e-12)
+    # Windows without a single frame of audio score zero
+    assert scores[4] == scores[5] == scores[7] == 0.0
+
+if __name__ == "__main__":
+    print("🧪 Testing engagement analysis helpers")
+    print("=" * 50)
+    for test in (test_combine_segments_matches_reference, test_audio_features_match_librosa,
+                 test_audio_engagement_matches_reference):
+        test()
+        print(f"✅ {test.__name__}")
@@ -58,32 +58,18 @@ def test_pipeline():
                       f"(Score: {segment['engagement_score']:.3f})")
                 print(f"     Text: {segment['text'][:100]}...")
         
-        # Test video combination (just one clip)
+        # Test clip rendering (just one clip)
         if segments:
-            print("\n🎬 Testing video combination...")
+            print("\n🎬 Testing clip rendering (split screen + subtitles)...")
             segment = segments[0]
-            combined_path = pipeline.combine_videos(
+            final_path = pipeline.render_clip(
                 podcast_path,
                 gameplay_path,
-                segment['start_time'],
-                segment['end_time']
-            )
-            print(f"✅ Combined video created: {combined_path}")
-            
-            # Test subtitle addition
-            print("\n💬 Testing subtitle addition...")
-            final_path = pipeline.add_subtitles(
-                combined_path,
                 transcript_data,
                 segment['start_time'],
                 segment['end_time']
             )
             print(f"✅ Final video with subtitles: {final_path}")
-            
-            # Clean up test files
-            if os.path.exists(combined_path):
-                os.remove(combined_path)
-                print("🧹 Cleaned up intermediate files")
         
         print("\n🎉 All tests passed! Pipeline is working correctly.")
         return True
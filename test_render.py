@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the ffmpeg clip rendering helpers
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from types import MappingProxyType
+import clips
+from clips import YouTubeToShortsPipeline, _escape_filter_path
+from config import SUBTITLE_CONFIG
+
+def _ffmpeg_unescape(value, special):
+    """Undo one level of ffmpeg backslash/quote escaping, like av_get_token"""
+    out, quoted, i = [], False, 0
+    while i < len(value):
+        char = value[i]
+        if char == "'":
+            quoted = not quoted
+        elif char == "\\" and not quoted and i + 1 < len(value):
+            i += 1
+            out.append(value[i])
+        else:
+            assert quoted or char not in special, f"unescaped {char!r} in {value!r}"
+            out.append(char)
+        i += 1
+    assert not quoted, f"unterminated quote in {value!r}"
+    return "".join(out)
+
+def test_escape_filter_path():
+    """Escaped paths survive ffmpeg's filtergraph and option parsing"""
+    for path in [
+        "temp/subtitles.ass",
+        "/videos/Joe's Podcast/temp/subtitles.ass",
+        "/videos/Don't, stop [live]; part 2/C:/subtitles.ass",
+    ]:
+        graph_level = _ffmpeg_unescape(_escape_filter_path(path), "[],;")
+        assert _ffmpeg_unescape(graph_level, ":") == path
+
+def test_group_overlapping_clips():
+    """Only overlapping clip windows share a covering interval"""
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = YouTubeToShortsPipeline(project_root=tmp)
+        group = pipeline._group_overlapping_clips
+        
+        # Overlapping, given out of order, including one nested window
+        assert group([(50, 80), (10, 40), (30, 60), (35, 45)]) == [(10, 80, [1, 2, 3, 0])]
+        # Adjacent windows touch but share no frames, so they stay apart
+        assert group([(0, 30), (30, 60)]) == [(0, 30, [0]), (30, 60, [1])]
+        # Disjoint windows
+        assert group([(100, 130), (0, 20)]) == [(0, 20, [1]), (100, 130, [0])]
+        # A mix of all three
+        assert group([(0, 30), (20, 40), (40, 55), (90, 120)]) == [
+            (0, 40, [0, 1]), (40, 55, [2]), (90, 120, [3])
+        ]
+        assert group([]) == []
+
+def test_write_ass_fades_only_long_events():
+    """Chunks too short for both fades are shown without \\fad, still positioned"""
+    fade = SUBTITLE_CONFIG['fade_duration']
+    subtitles = [
+        ((1.0, 1.0 + fade), "too short"),
+        ((0.0, 2 * fade), "exactly two fades"),
+        ((4.0, 5.5), "long enough"),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = YouTubeToShortsPipeline(project_root=tmp)
+        path = pipeline._write_ass(subtitles, os.path.join(tmp, "subtitles.ass"))
+        with open(path, encoding='utf-8') as f:
+            events = [line for line in f if line.startswith("Dialogue:")]
+    
+    assert len(events) == 3
+    faded = [r"\fad(" in event for event in events]
+    if SUBTITLE_CONFIG['highlight_effect']:
+        assert faded == [False, False, True]
+    else:
+        assert not any(faded)
+    if SUBTITLE_CONFIG['position'] == 'center':
+        assert all(r"\pos(" in event for event in events)
+
+def test_unsupported_color_fails_at_construction():
+    """A subtitle color libass can't use is rejected before any work starts"""
+    original = clips.SUBTITLE_CONFIG
+    clips.SUBTITLE_CONFIG = MappingProxyType({**original, 'font_color': 'orange'})
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                YouTubeToShortsPipeline(project_root=tmp)
+            except ValueError as e:
+                assert "'orange'" in str(e)
+            else:
+                raise AssertionError("an unsupported color was accepted")
+    finally:
+        clips.SUBTITLE_CONFIG = original
+
+def test_render_command_with_apostrophe():
+    """A project root with an apostrophe still yields a working filtergraph"""
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = YouTubeToShortsPipeline(project_root=os.path.join(tmp, "Joe's clips"))
+        subtitle_path = pipeline.build_ass(
+            {"segments": [{"start": 0.2, "end": 1.5, "text": " Don't stop now"}]}
+        )
+        output_paths = [os.path.join(pipeline.project_root, "outputs", "clip.mp4")]
+        cmd = pipeline._render_command(
+            "podcast.mp4", "gameplay.mp4", [(0, 2)], output_paths, subtitle_path
+        )
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert f"ass=filename={_escape_filter_path(subtitle_path)}," in graph
+
+        if shutil.which("ffmpeg") is None:
+            print("⚠️  ffmpeg not found, skipping the render itself")
+            return
+
+        # Run the same command on short generated sources
+        sources = {"podcast.mp4": "testsrc", "gameplay.mp4": "testsrc2"}
+        for name, source in sources.items():
+            subprocess.run([
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-f", "lavfi", "-i", f"{source}=size=320x180:rate=30:duration=3",
+                os.path.join(tmp, name)
+            ], check=True)
+        cmd = pipeline._render_command(
+            os.path.join(tmp, "podcast.mp4"), os.path.join(tmp, "gameplay.mp4"),
+            [(0, 2)], output_paths, subtitle_path
+        )
+        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        assert os.path.getsize(output_paths[0]) > 0
+
+if __name__ == "__main__":
+    print("🧪 Testing clip rendering helpers")
+    print("=" * 50)
+    for test in (test_escape_filter_path, test_group_overlapping_clips,
+                 test_write_ass_fades_only_long_events,
+                 test_unsupported_color_fails_at_construction,
+                 test_render_command_with_apostrophe):
+        test()
+        print(f"✅ {test.__name__}")
@@ -31,18 +31,21 @@ def test_youtube_download():
             "test"
         )
         
-        if os.path.exists(downloaded_path):
-            print(f"✅ Download successful! File: {downloaded_path}")
-            print(f"📁 File size: {os.path.getsize(downloaded_path)} bytes")
-            
-            # Clean up test file
-            os.remove(downloaded_path)
-            print("🧹 Test file cleaned up")
-            
-            return True
-        else:
+        # One stat both confirms the file exists and gives its size
+        try:
+            file_size = os.stat(downloaded_path).st_size
+        except OSError:
             print("❌ Download failed - file not found")
             return False
+        
+        print(f"✅ Download successful! File: {downloaded_path}")
+        print(f"📁 File size: {file_size} bytes")
+        
+        # Clean up test file
+        os.remove(downloaded_path)
+        print("🧹 Test file cleaned up")
+        
+        return True
             
     except Exception as e:
         print(f"❌ Download test failed: {e}")
@@ -1,25 +1,34 @@
 import os
 import time
-# from pytube import YouTube
 import sys
-import moviepy
-from moviepy.editor import *
-from moviepy.video.io.VideoFileClip import VideoFileClip
-from moviepy.video.tools.subtitles import SubtitlesClip
+import subprocess
+from yt_dlp import YoutubeDL
+from config import VIDEO_CONFIG
+from ffmpeg_utils import select_video_codec, video_codec_params, video_decode_params
 
 def downloadVideo(vid_url, save_path):
     try:
         start_time = time.time()
-        yt = YouTube(vid_url)
-
-        print("[ Video Details ]")
-        print("Title:", yt.title)
-        print("Author:", yt.author)
-        print("Views:", yt.views)
-        print("Video Length:", getTimeFormat(yt.length))
-
-        you = yt.streams.get_highest_resolution()
-        you.download(save_path)
+        options = {
+            # Best video up to 1080p plus best audio, muxed by ffmpeg in one go
+            'format': 'bestvideo[height<=1080]+bestaudio/best',
+            'merge_output_format': 'mp4',
+            'outtmpl': os.path.join(save_path, '%(title)s.%(ext)s'),
+            'concurrent_fragment_downloads': 4,
+            'http_chunk_size': 10 * 1024 * 1024,
+        }
+
+        with YoutubeDL(options) as ydl:
+            # One metadata request, reused for the download itself
+            info = ydl.extract_info(vid_url, download=False)
+
+            print("[ Video Details ]")
+            print("Title:", info.get("title"))
+            print("Author:", info.get("uploader"))
+            print("Views:", info.get("view_count"))
+            print("Video Length:", getTimeFormat(info.get("duration") or 0))
+
+            ydl.process_ie_result(info, download=True)
 
         end_time = time.time()
         elapsed_time = round((end_time - start_time), 2)
@@ -30,35 +39,21 @@ def downloadVideo(vid_url, save_path):
 
 def downloadAudio(vid_url, save_path):
     start_time = time.time()
-    yt = YouTube(vid_url)
-    audio = yt.streams.filter(only_audio=True).first()
-    audio.download(save_path)
+    options = {
+        'format': 'bestaudio/best',
+        'outtmpl': os.path.join(save_path, '%(title)s.%(ext)s'),
+        'concurrent_fragment_downloads': 4,
+    }
+    with YoutubeDL(options) as ydl:
+        ydl.download([vid_url])
     end_time = time.time()
     elapsed_time = int(end_time - start_time)
     print("\n[ Audio downloaded in {:.2f} seconds ]\n".format(elapsed_time))
 
-def getTimeFormat(seconds):
-    remMin, remSec = divmod(int(seconds), 60)
-    hours, minutes = divmod(remMin, 60)
-    return "{:02}:{:02}:{:02}".format(hours, minutes, remSec) #good to know!
-
-    # hrStr = ""
-    # minStr = ""
-    # secStr = ""
-    # if len(str(hours)) == 1:
-    #     hrStr += "0"+str(hours)
-    # else:
-    #     hrStr += str(hours)
-    # if len(str(minutes)) == 1:
-    #     minStr += "0"+str(minutes)
-    # else:
-    #     minStr += str(minutes)
-    # if len(str(remSec)) == 1:
-    #     secStr += "0"+str(remSec)
-    # else:
-    #     secStr += str(remSec)
-    
-    # return f"{hrStr}:{minStr}:{secStr}"
+def getTimeFormat(seconds: int) -> str:
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 def main():
     # https://www.youtube.com/watch?v=vEQ8CXFWLZU
@@ -75,24 +70,51 @@ def main():
     # downloadAudio(u, os.path.join(os.getcwd(), "savedAudios"))
 
 
-def split_main_video(input_video, output_path, start_time, end_time):
-    video = VideoFileClip(input_video).subclip(start_time, end_time)
-    video.write_videofile(output_path, codec='libx264', audio_codec='aac')
-    video.close()
-
-if not os.path.exists("outputFolder"):
-    os.makedirs("outputFolder")
-
-# Replace these with your actual start and end times from the heatmap data
-start_time_1, end_time_1 = 0, 60  # seconds
-start_time_2, end_time_2 = 60, 120  # seconds
-
-# Specify the input video file
-input_video_path = "savedVideos/main_vid.mp4"
-
-# Split the video into chunks
-output_file_1 = os.path.join("outputFolder", 'chunk_1.mp4')
-output_file_2 = os.path.join("outputFolder", 'chunk_2.mp4')
-
-split_main_video(input_video_path, output_file_1, start_time_1, end_time_1)
-split_main_video(input_video_path, output_file_2, start_time_2, end_time_2)
\ No newline at end of file
+def split_main_video_batch(input_video, cuts, accurate=False):
+    # One ffmpeg process for every (output_path, start_time, end_time) cut.
+    # Each cut opens the source as its own input so it keeps a fast input-side
+    # seek, and its streams are mapped to its own output file.
+    # Stream copy cuts on keyframes without decoding or re-encoding anything;
+    # accurate=True re-encodes for frame-exact boundaries instead, on the
+    # hardware encoder (and decoder) when one is available
+    if accurate:
+        codec = select_video_codec()
+        decode_args = video_decode_params(codec)
+        codec_args = ["-c:v", codec, *video_codec_params(codec),
+                      "-c:a", VIDEO_CONFIG["audio_codec"]]
+    else:
+        decode_args = []
+        codec_args = ["-c", "copy", "-avoid_negative_ts", "make_zero"]
+
+    inputs, outputs = [], []
+    for index, (output_path, start_time, end_time) in enumerate(cuts):
+        inputs += [*decode_args, "-ss", str(start_time), "-to", str(end_time), "-i", input_video]
+        outputs += ["-map", str(index), *codec_args, output_path]
+
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", *inputs, *outputs], check=True)
+
+def split_main_video(input_video, output_path, start_time, end_time, accurate=False):
+    split_main_video_batch(input_video, [(output_path, start_time, end_time)], accurate)
+
+def _demo():
+    if not os.path.exists("outputFolder"):
+        os.makedirs("outputFolder")
+
+    # Replace these with your actual start and end times from the heatmap data
+    start_time_1, end_time_1 = 0, 60  # seconds
+    start_time_2, end_time_2 = 60, 120  # seconds
+
+    # Specify the input video file
+    input_video_path = "savedVideos/main_vid.mp4"
+
+    # Split the video into chunks
+    output_file_1 = os.path.join("outputFolder", 'chunk_1.mp4')
+    output_file_2 = os.path.join("outputFolder", 'chunk_2.mp4')
+
+    split_main_video_batch(input_video_path, [
+        (output_file_1, start_time_1, end_time_1),
+        (output_file_2, start_time_2, end_time_2)
+    ])
+
+if __name__ == "__main__":
+    _demo()